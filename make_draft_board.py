@@ -5,14 +5,21 @@ Fantasy Football ADP data draftboard builder.
 """
 
 import argparse
+import io
 import logging
 import os
 import csv
-import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML
+from functools import lru_cache
+from operator import itemgetter
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from weasyprint import HTML, default_url_fetcher
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Used for ARGS validation
@@ -50,42 +57,85 @@ PLAYER_NAME_MAP = {"Travis Etienne Jr.": "travis_etienne",
                    "Robert Tonyan": "robert_tonyan"
                   }
 
-MY_GUYS = {"allen_robinson",
-           "aj_dillon",
-           "mike_williams",
-           "jalen_hurts",
-           "chase_edmonds",
-           "gabe_davis",
-           "courtland_sutton",
-           "allen_lazard",
-           "michael_pittman_jr"}
+MY_GUYS = frozenset({"allen_robinson",
+                     "aj_dillon",
+                     "mike_williams",
+                     "jalen_hurts",
+                     "chase_edmonds",
+                     "gabe_davis",
+                     "courtland_sutton",
+                     "allen_lazard",
+                     "michael_pittman_jr"})
 
-SKIP_PLAYERS = {"blaine_gabbert",
-                "calvin_ridley"}
+SKIP_PLAYERS = frozenset({"blaine_gabbert",
+                          "calvin_ridley"})
 
+# Positions used on the draft board
+_VALID_POSITIONS = frozenset({"QB", "RB", "WR", "TE"})
+
+# Used to build the player keys in one pass over the name
+_NAME_TABLE = str.maketrans({" ": "_", ".": None, "'": None})
+
+# Compiled templates are cached here between runs
+JINJA_CACHE_DIR = "./.jinja_cache"
+
+# The jinja2 Environment shared by the generators
+JINJA_ENV = Environment(loader=FileSystemLoader("./templates/"),
+                        bytecode_cache=FileSystemBytecodeCache(directory=JINJA_CACHE_DIR),
+                        auto_reload=False,
+                        trim_blocks=True,
+                        lstrip_blocks=True)
+
+# Table row of the PDF draft board, rendered outside of jinja2
+PDF_ROW_FORMAT = ("<tr><td>{name}{my_guy}</td><td>{team} [{bye}]</td><td>{rank}</td>"
+                  "<td>{adp}</td><td>{adp_formatted}</td>"
+                  "<td>{andy} / {mike} / {jason}</td></tr>")
+
+# Columns used from the player ranking CSVs
+RANKING_COLUMNS = ("Name", "Team", "Rank", "Andy", "Mike", "Jason")
+
+# File where the SportsData.IO data is saved to
+SD_EXPORT_JSON = "./files/sports_data_io.json"
+
+@lru_cache(maxsize=None)
 def get_player_key(name):
     """
     get_player_key Generates the dictionary key for the player with their full name.
+    Cached since the same names are looked up by each data source.
 
     :param name: The players name to create key from
     :return The key to use in the dictionary
     """
 
-    key = name.replace(' ', '_').replace('.', '').replace("'", '').lower()
+    # Check for a key mapping with this player, build it from the name if not
+    return PLAYER_NAME_MAP.get(name) or name.translate(_NAME_TABLE).lower()
 
-    # Check for a key mapping with this player
-    if name in PLAYER_NAME_MAP:
-        key = PLAYER_NAME_MAP[name]
 
-    return key
+def get_session():
+    """
+    get_session Builds a requests Session shared by the API calls.
+    Keeps connections pooled so the TCP/TLS setup is reused and retries server errors.
+
+    :return The requests Session
+    """
+
+    # Return the last response once retries run out so the API error is still logged
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                    raise_on_status=False)
 
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, max_retries=retries))
 
-def get_adp_data(datamap):
+    return session
+
+
+def fetch_adp_data(session, datamap):
     """
-    get_adp_data Makes a call to the ADP data source and build Dict of ADP data
+    fetch_adp_data Makes a call to the ADP data source
 
+    :param session: The requests Session to make the call with
     :param datamap: The values to build the API call
-    :return A dict of the ADP data
+    :return The ADP API Response
     """
 
     # Build the request URL
@@ -97,23 +147,71 @@ def get_adp_data(datamap):
     except Exception as ex: # pylint: disable=broad-except
         logging.error("datamap Dict must have all Keys: %s", str(ex))
 
+    # Send the saved validators so unchanged ADP data is not downloaded again
+    headers = {}
+    adp_export_headers = f"{datamap['adp_export_json']}.headers"
+    if os.path.isfile(datamap["adp_export_json"]) and os.path.isfile(adp_export_headers):
+        with open(adp_export_headers, "rb") as adp_f:
+            validators = orjson.loads(adp_f.read())
+
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
     # Build and call ADP URL
     url = f"{adp_base_url}/{scoring_format}?position=all&teams={player_count}&year={year}"
     logging.info("Calling ADP URL %s", url)
-    adp_r = requests.get(url)
+
+    return session.get(url, headers=headers)
+
+
+def get_adp_data(datamap, adp_r):
+    """
+    get_adp_data Build Dict of ADP data from the ADP API Response.
+    Saves the response to cache, or loads the cache if the ADP data is not modified.
+
+    :param datamap: The values to build the dataset
+    :param adp_r: The ADP API Response
+    :return A dict of the ADP data
+    """
+
+    adp_export_json = datamap["adp_export_json"]
 
     # Validata success and get values
-    adp_data = {}
+    adp_pairs = []
     if adp_r.ok:
-        adp_r_json = adp_r.json()
+        if adp_r.status_code == 304:
+            logging.error("======= ADP NOT MODIFIED, LOADING FROM CACHE =======")
+            with open(adp_export_json, "rb") as adp_f:
+                adp_r_json = orjson.loads(adp_f.read())
+        else:
+            adp_r_json = orjson.loads(adp_r.content)
+
         if adp_r_json.get("status", "bad") == "Success":
+            # Save out the response and its validators to file
+            if adp_r.status_code != 304:
+                with open(adp_export_json, "wb") as adp_f:
+                    adp_f.write(adp_r.content)
+                with open(f"{adp_export_json}.headers", "wb") as adp_f:
+                    adp_f.write(orjson.dumps({
+                        "etag": adp_r.headers.get("ETag"),
+                        "last_modified": adp_r.headers.get("Last-Modified")
+                    }))
+
             overall_ranking = 0
+            seen_keys = set()
             for player in adp_r_json["players"]:
+                # Drop Kickers and Defense, they still count in the overall ranking
+                if player["position"] not in _VALID_POSITIONS:
+                    overall_ranking += 1
+                    continue
+
                 # Make the Dict key from player name
                 key = get_player_key(player["name"])
 
                 # Log when duplicate players are found
-                if key in adp_data:
+                if key in seen_keys:
                     logging.error("%s has duplicate hits.", player["name"])
 
                 if key in SKIP_PLAYERS:
@@ -124,7 +222,8 @@ def get_adp_data(datamap):
                 player["overall_rank"] = overall_ranking
 
                 # Set the player key/value
-                adp_data[key] = player
+                seen_keys.add(key)
+                adp_pairs.append((key, player))
         else:
             logging.error("Bad API call with Status: %s", adp_r_json.get("status"))
             raise Exception("Bad ADP API Call Status")
@@ -132,7 +231,50 @@ def get_adp_data(datamap):
         logging.error("Bad API call: %s", adp_r.text)
         raise Exception("Bad ADP API Call")
 
-    return adp_data
+    # Build the Dict in one go, later duplicates win
+    return dict(adp_pairs)
+
+
+def read_player_rankings(file_path):
+    """
+    read_player_rankings Reads a player ranking CSV.
+
+    :param file_path: The path of the ranking CSV
+    :return A list of the ranking rows with the values ordered as RANKING_COLUMNS
+    """
+
+    # Check if the file exists
+    if not os.path.isfile(file_path):
+        logging.error("Ranking File %s Does Not Exist", file_path)
+        return []
+
+    # Open CSV and parse data
+    with open(file_path, "r", encoding="utf-8") as pr_f:
+        player_list = csv.reader(pr_f)
+
+        # Look up the columns once instead of building a Dict per row
+        header = next(player_list, [])
+        try:
+            column_indexes = [header.index(column) for column in RANKING_COLUMNS]
+        except ValueError as ex:
+            logging.error("Ranking File %s Bad Header: %s", file_path, str(ex))
+            return []
+
+        rankings = []
+        for player in player_list:
+            # Skip blank lines
+            if not player:
+                continue
+
+            # Rows missing columns can not be read
+            if len(player) < len(header):
+                logging.error("Bad Values for %s : %s", ",".join(player),
+                              f"{len(player)} of {len(header)} columns")
+                continue
+
+            rankings.append([player[i] for i in column_indexes])
+
+        return rankings
 
 
 def add_player_rankings(datamap, adp_data):
@@ -146,42 +288,41 @@ def add_player_rankings(datamap, adp_data):
 
     position_files = ["qb.csv", "rb.csv", "wr.csv", "te.csv"]
     scoring_format = datamap["scoring_format"]
-    for position in position_files:
-        file_path = f"./ffrd/{scoring_format}/{position}"
-
-        # Check if the file exists
-        if not os.path.isfile(file_path):
-            logging.error("Ranking File %s Does Not Exist", file_path)
-            continue
-
-        # Open CSV and parse data
-        with open(file_path, "r", encoding="utf-8") as pr_f:
-            player_list = csv.DictReader(pr_f)
-            for player in player_list:
-                # Make the Dict key from player name
-                key = get_player_key(player["Name"])
-
-                # If player has no ADP put them in to add the Rankings
-                if not key in adp_data:
-                    adp_data[key] = {
-                        "name": player["Name"],
-                        "position": position.replace(".csv", "").upper(),
-                        "team": player["Team"],
-                        "adp": 1000.0 + int(player["Rank"]),
-                        "adp_formatted": "19.0"
-                    }
-
-                # Set the My Guys boolean
-                adp_data[key]["my_guy"] = True if key in MY_GUYS else False
-
-                # Set the Rankings in ADP
-                try:
-                    adp_data[key]["rank"] = int(player["Rank"])
-                    adp_data[key]["andy"] = int(player["Andy"])
-                    adp_data[key]["mike"] = int(player["Mike"])
-                    adp_data[key]["jason"] = int(player["Jason"])
-                except Exception as ex: # pylint: disable=broad-except
-                    logging.error("Bad Values for %s : %s", player["Name"], str(ex))
+    file_paths = [f"./ffrd/{scoring_format}/{position}" for position in position_files]
+
+    # Read the files at the same time, the rankings are merged in order
+    with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+        position_rankings = list(executor.map(read_player_rankings, file_paths))
+
+    for position, player_list in zip(position_files, position_rankings):
+        position_name = position.replace(".csv", "").upper()
+        for name, team, rank, andy, mike, jason in player_list:
+            # Make the Dict key from player name
+            key = get_player_key(name)
+
+            # If player has no ADP put them in to add the Rankings
+            if not key in adp_data:
+                adp_data[key] = {
+                    "name": name,
+                    "position": position_name,
+                    "team": team,
+                    "adp": 1000.0 + int(rank),
+                    "adp_formatted": "19.0"
+                }
+
+            # Set the My Guys boolean
+            adp_data[key]["my_guy"] = key in MY_GUYS
+
+            # Set the Rankings in ADP
+            try:
+                adp_data[key].update({
+                    "rank": int(rank),
+                    "andy": int(andy),
+                    "mike": int(mike),
+                    "jason": int(jason)
+                })
+            except Exception as ex: # pylint: disable=broad-except
+                logging.error("Bad Values for %s : %s", name, str(ex))
 
 
 def organize_db_data(adp_data):
@@ -195,105 +336,172 @@ def organize_db_data(adp_data):
     # Init the return data
     db_data = {"qb": [], "rb": [], "wr": [], "te": []}
 
-    # Build the position lists
-    for player_k in adp_data:
-        position_k = adp_data[player_k]["position"].lower()
+    # Map the stored positions to their list append. Other positions are skipped.
+    position_append = {position_k.upper(): position_list.append
+                       for position_k, position_list in db_data.items()}
 
-        # Check the position is valid. Skips Kickers and Defense
-        if position_k in {'def', 'pk'}:
-            continue
-
-        # Postion in Draft Board Dict
-        if position_k in db_data:
-            db_data[position_k].append(adp_data[player_k])
-        else:
-            logging.error("Position %s not found", position_k)
+    # Build the position lists
+    for player in adp_data.values():
+        append = position_append.get(player["position"])
+        if append is not None:
+            append(player)
 
-    # Sork the position lists
-    for position_k in db_data:
-        db_data[position_k] = sorted(db_data[position_k], key=lambda d: d["adp"])
+    # Sort the position lists
+    for position_list in db_data.values():
+        position_list.sort(key=itemgetter("adp"))
 
     return db_data
 
 
-def get_sportsdataio_data(datamap, adp_data, clear_cache):
+def load_sportsdataio_cache(clear_cache):
     """
-    get_sportsdataio_data Calls the API of SportsData.io to get player information.
-    Maps the depth chart information to the adp_data.
+    load_sportsdataio_cache Loads the SportsData.io player information from cache.
 
-    :param datamap: The values to build the dataset
-    :param adp_data: A Dict of the current ADP data w/ Key being the player names
     :param clear_cache: Boolean to clear the cache data
+    :return A list of the cached player information. Empty if not cached.
     """
 
-    # File where the data is saved to
-    sd_export_json = "./files/sports_data_io.json"
-    sdio_json = {}
+    sdio_json = []
 
-    if os.path.isfile(sd_export_json):
+    if os.path.isfile(SD_EXPORT_JSON):
         if clear_cache is False:
             logging.error("======= LOADING SPORTSDATA.IO FROM CACHE (clear with flag -csd) =======")
 
             # Load the data from file
-            with open(sd_export_json, "r", encoding="utf-8") as sd_f:
-                sdio_json = json.load(sd_f)
+            sdio_json = read_sportsdataio_data()
 
-    # If the data was not set from cache try to Call API
-    if len(sdio_json) < 1:
-        # Check if key is defined
-        if datamap["sports_data_api_key"] is None:
-            logging.error("SportsData.IO Key is not defined")
-            return
+    return sdio_json
+
+
+def fetch_sportsdataio_data(session, datamap, pretty=False):
+    """
+    fetch_sportsdataio_data Calls the API of SportsData.io to get player information.
+    The response is streamed to a download file that replaces the cache once it parses.
+
+    :param session: The requests Session to make the call with
+    :param datamap: The values to build the API call
+    :param pretty: Boolean to indent the cached JSON
+    :return A list of the player information. Empty if the key is not defined.
+    """
+
+    # Check if key is defined
+    if datamap["sports_data_api_key"] is None:
+        logging.error("SportsData.IO Key is not defined")
+        return []
+
+    # Build the request URL
+    try:
+        sportsdataio_base_url = datamap["sportsdataio_base_url"]
+        sports_data_api_key = datamap["sports_data_api_key"]
+    except Exception as ex: # pylint: disable=broad-except
+        logging.error("datamap Dict must have all Keys: %s", str(ex))
+
+    # Build and call ADP URL
+    url = f"{sportsdataio_base_url}/v3/nfl/scores/json/Players"
+    logging.info("Calling ADP URL %s", url)
+
+    sd_download = f"{SD_EXPORT_JSON}.download"
+    try:
+        with session.get(url, headers={"Ocp-Apim-Subscription-Key": sports_data_api_key},
+                         stream=True) as sdio_r:
+            # Check for successful API call
+            if not sdio_r.ok:
+                logging.error("Bad API call: %s", sdio_r.text)
+                raise Exception("Bad SportData.IO API Call")
+
+            # Save out the data to file as it downloads
+            with open(sd_download, "wb") as sd_f:
+                for chunk in sdio_r.iter_content(chunk_size=65536):
+                    sd_f.write(chunk)
+
+        # Validate the download before it replaces the cache
+        with open(sd_download, "rb") as sd_f:
+            sdio_json = orjson.loads(sd_f.read())
+    except Exception as ex: # pylint: disable=broad-except
+        # Never leave a partial or bad download behind
+        if os.path.isfile(sd_download):
+            os.remove(sd_download)
+
+        if isinstance(ex, orjson.JSONDecodeError):
+            logging.error("Bad SportsData.IO JSON: %s", str(ex))
+            raise Exception("Bad SportData.IO API Call") from ex
+        raise
+
+    # Only replace the cache once the download is complete and valid
+    if pretty:
+        with open(sd_download, "wb") as sd_f:
+            sd_f.write(orjson.dumps(sdio_json, option=orjson.OPT_INDENT_2))
+    os.replace(sd_download, SD_EXPORT_JSON)
+
+    return sdio_json
+
+
+def read_sportsdataio_data():
+    """
+    read_sportsdataio_data Reads the SportsData.io player information from the cache file.
+
+    :return A list of the player information
+    """
+
+    with open(SD_EXPORT_JSON, "rb") as sd_f:
+        return orjson.loads(sd_f.read())
 
-        # Build the request URL
-        try:
-            sportsdataio_base_url = datamap["sportsdataio_base_url"]
-            sports_data_api_key = datamap["sports_data_api_key"]
-        except Exception as ex: # pylint: disable=broad-except
-            logging.error("datamap Dict must have all Keys: %s", str(ex))
-
-        # Build and call ADP URL
-        url = f"{sportsdataio_base_url}/v3/nfl/scores/json/Players"
-        logging.info("Calling ADP URL %s", url)
-        sdio_r = requests.get(url, headers={"Ocp-Apim-Subscription-Key": sports_data_api_key})
-
-        # Check for successful API call
-        if sdio_r.ok:
-            sdio_json = sdio_r.json()
-
-            # Save out the data to file
-            with open(sd_export_json, "w", encoding="utf-8") as sd_f:
-                sd_f.write(json.dumps(sdio_json, indent=4))
-        else:
-            logging.error("Bad API call: %s", sdio_r.text)
-            raise Exception("Bad SportData.IO API Call")
+
+def get_sportsdataio_data(sdio_json, adp_data):
+    """
+    get_sportsdataio_data Maps the SportsData.io depth chart information to the adp_data.
+
+    :param sdio_json: The list of SportsData.IO player information
+    :param adp_data: A Dict of the current ADP data w/ Key being the player names
+    """
 
     # Check if data exists. Map values if so.
     if len(sdio_json) > 0:
         # Loop the values and set the information per player
         for player in sdio_json:
+            # Skip positions that are not on the draft board
+            if player["Position"] not in _VALID_POSITIONS:
+                continue
+
             # Make the Dict key from player name
             key = get_player_key(player["Name"])
 
             # Check for the existing player
-            if key in adp_data:
+            adp_player = adp_data.get(key)
+            if adp_player is not None:
                 # Validate the position is a correct match
-                if adp_data[key]["position"].lower() == player["Position"].lower():
+                if adp_player["position"].lower() == player["Position"].lower():
                     # Set values
-                    adp_data[key]["depth_order"] = player["DepthOrder"]
-                    adp_data[key]["depth_display_order"] = player["DepthDisplayOrder"]
+                    adp_player.update({
+                        "depth_order": player["DepthOrder"],
+                        "depth_display_order": player["DepthDisplayOrder"]
+                    })
     else:
         logging.error("No SportsData.IO Data loaded")
 
 
+def local_url_fetcher(url):
+    """
+    local_url_fetcher WeasyPrint URL fetcher that only loads local resources.
+    Remote resources are skipped so the PDF render never waits on the network.
+
+    :param url: The URL of the resource to load
+    :return A dict of the resource for WeasyPrint
+    """
+
+    if url.startswith(("file:", "data:")):
+        return default_url_fetcher(url)
+
+    logging.error("Skipping remote PDF resource %s", url)
+    return {"string": b"", "mime_type": "text/plain"}
+
+
 def generate_html_v1(datamap, draft_board_data):
     """
     generate_html_v1 Version 1 of the HTML draftboard file
     """
 
-    # Setup the jinja2 Environment
-    environment = Environment(loader=FileSystemLoader("./templates/"))
-    template = environment.get_template("draftboard.html")
+    template = JINJA_ENV.get_template("draftboard.html")
 
     content = template.render(datamap=datamap, draft_board_data=draft_board_data)
     file_key = f"{datamap['year']}_{datamap['scoring_format']}_{datamap['player_count']}"
@@ -303,25 +511,48 @@ def generate_html_v1(datamap, draft_board_data):
         message.write(content)
 
 
-def generate_pdf_v1(datamap, draft_board_data):
+def render_pdf_rows(players):
+    """
+    render_pdf_rows Pre-renders the PDF draft board table rows for a position.
+    Missing values are left blank.
+
+    :param players: The sorted list of players for the position
+    :return The HTML of the table rows
+    """
+
+    rows = []
+    for player in players:
+        fields = defaultdict(str, player)
+        fields["my_guy"] = "*" if player.get("my_guy") else ""
+        rows.append(PDF_ROW_FORMAT.format_map(fields))
+
+    return "".join(rows)
+
+
+def generate_pdf_v1(datamap, draft_board_data, fast=False):
     # player_data_grouped = {}
     # for player in adp_data:
     #     if adp_data[player]["position"] not in player_data_grouped:
     #         player_data_grouped[adp_data[player]["position"]] = []
     #     player_data_grouped[adp_data[player]["position"]].append(adp_data[player])
 
-    # Setup the jinja2 Environment
-    env = Environment(loader=FileSystemLoader("./templates/"))
-    template = env.get_template("draft_board.html")
+    template = JINJA_ENV.get_template("draft_board.html")
 
-    content = template.render(player_data=draft_board_data)
+    # Encode once, the same bytes feed the PDF and the HTML copy
+    player_rows = {position_k: render_pdf_rows(players)
+                   for position_k, players in draft_board_data.items()}
+    content = template.render(player_data=draft_board_data,
+                              player_rows=player_rows).encode("utf-8")
     file_key = f"{datamap['year']}_{datamap['scoring_format']}_{datamap['player_count']}"
     file_name = "./files/"
     file_name += f"db_v2_{file_key}.pdf"
 
-    HTML(string=content).write_pdf(file_name)
+    # Fast runs skip the font subsetting size optimization
+    HTML(file_obj=io.BytesIO(content), encoding="utf-8",
+         url_fetcher=local_url_fetcher).write_pdf(file_name,
+                                                  optimize_size=() if fast else ("fonts",))
 
-    with open(f"{file_name}.html", mode="w", encoding="utf-8") as message:
+    with open(f"{file_name}.html", mode="wb") as message:
         message.write(content)
 
 
@@ -342,6 +573,10 @@ def main():
     parser.add_argument('-cc', '--clear_cache', help="clears the cached data", action='store_true')
     parser.add_argument('-csd', '--clear_sd', help="clears the cached of SportsData.IO",
                         action='store_true')
+    parser.add_argument('-p', '--pretty', help="indents the cached JSON files",
+                        action='store_true')
+    parser.add_argument('-f', '--fast', help="builds a larger PDF faster, for testing",
+                        action='store_true')
 
     args = parser.parse_args()
 
@@ -359,33 +594,51 @@ def main():
 
     run_info = f"{datamap['scoring_format']}_{datamap['player_count']}_{datamap['year']}"
     export_json = f"./files/draft_board_data_{run_info}.json"
+    datamap["adp_export_json"] = f"./files/adp_data_{run_info}.json"
     adp_data = {}
 
     # Check for the Cache file to exist. Load if so.
     if os.path.isfile(export_json) and args.clear_cache is False:
         logging.error("======= LOADING DATA FROM CACHE (clear with flag -cc) =======")
-        with open(export_json, "r", encoding="utf-8") as db_f:
-            adp_data = json.load(db_f)
+        with open(export_json, "rb") as db_f:
+            adp_data = orjson.loads(db_f.read())
     else:
-        # Get the ADP data to dict
-        adp_data = get_adp_data(datamap)
+        sdio_json = load_sportsdataio_cache(args.clear_sd)
+
+        # Call the APIs at the same time, the responses are handled in order
+        with get_session() as session, ThreadPoolExecutor(max_workers=2) as executor:
+            adp_future = executor.submit(fetch_adp_data, session, datamap)
+
+            sdio_future = None
+            if len(sdio_json) < 1:
+                sdio_future = executor.submit(fetch_sportsdataio_data, session, datamap,
+                                              args.pretty)
 
-        # Merge in Player Rankings
-        add_player_rankings(datamap, adp_data)
+            # Get the ADP data to dict
+            adp_data = get_adp_data(datamap, adp_future.result())
+
+            # Merge in Player Rankings
+            add_player_rankings(datamap, adp_data)
+
+            if sdio_future is not None:
+                sdio_json = sdio_future.result()
 
         # Add in the Depth Cart information
-        get_sportsdataio_data(datamap, adp_data, args.clear_sd)
+        get_sportsdataio_data(sdio_json, adp_data)
 
         # Save out the data to file
-        with open(export_json, "w", encoding="utf-8") as db_f:
-            db_f.write(json.dumps(adp_data, indent=4))
+        with open(export_json, "wb") as db_f:
+            db_f.write(orjson.dumps(adp_data, option=orjson.OPT_INDENT_2 if args.pretty else None))
 
     # Build the draft board data
     draft_board_data = organize_db_data(adp_data)
 
+    # Make sure the template cache folder exists
+    os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+
     # Generate the HTML output
     generate_html_v1(datamap, draft_board_data)
-    generate_pdf_v1(datamap, draft_board_data)
+    generate_pdf_v1(datamap, draft_board_data, args.fast)
 
 
 if __name__ == "__main__":